@@ -3,6 +3,7 @@ Text chunking system with configurable window size and overlap.
 """
 
 from typing import List, Dict, Any, Optional
+from bisect import bisect_left, bisect_right
 import re
 import logging
 
@@ -200,11 +201,13 @@ class TextChunker:
         # Reconstruct full text and create page mapping
         full_text = ''.join(segment.text for segment in segments)
         
-        # Create offset to page mapping
-        offset_to_page = {}
-        for segment in segments:
-            for offset in range(segment.start_offset, segment.end_offset):
-                offset_to_page[offset] = segment.page_number
+        # Sort non-empty segments by start offset so page lookups can bisect
+        # segment boundaries instead of mapping every character offset
+        page_segments = sorted(
+            (segment for segment in segments if segment.end_offset > segment.start_offset),
+            key=lambda segment: segment.start_offset
+        )
+        segment_starts = [segment.start_offset for segment in page_segments]
         
         # Chunk the full text
         text_chunks = self.chunk_text(full_text, doc_id)
@@ -212,10 +215,13 @@ class TextChunker:
         # Add page information to chunks
         for chunk in text_chunks:
             # Find all pages that this chunk spans
-            pages = set()
-            for offset in range(chunk.start_offset, chunk.end_offset):
-                if offset in offset_to_page:
-                    pages.add(offset_to_page[offset])
+            first = max(0, bisect_right(segment_starts, chunk.start_offset) - 1)
+            last = bisect_left(segment_starts, chunk.end_offset)
+            pages = {
+                segment.page_number
+                for segment in page_segments[first:last]
+                if segment.start_offset < chunk.end_offset and segment.end_offset > chunk.start_offset
+            }
             
             chunk.page_numbers = sorted(pages)
             
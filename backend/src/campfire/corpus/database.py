@@ -2,9 +2,12 @@
 SQLite database management for document corpus with FTS5 support.
 """
 
+import re
 import sqlite3
+from contextlib import contextmanager
+from itertools import groupby
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,26 +16,61 @@ logger = logging.getLogger(__name__)
 class CorpusDatabase:
     """Manages SQLite database with FTS5 for document corpus."""
     
-    def __init__(self, db_path: str | Path):
+    # Maximum number of queries combined into one search_many() statement
+    MAX_COMPOUND_SEARCHES = 100
+    
+    # Size of the per-connection prepared statement cache, which sqlite3
+    # keys on the SQL text. Larger than the default of 128 so the up to
+    # MAX_COMPOUND_SEARCHES distinct search_many() statements do not evict
+    # the search() statement below
+    CACHED_STATEMENTS = 256
+    
+    # Query run by search()
+    SEARCH_SQL = """
+        SELECT 
+            c.rowid,
+            c.doc_id,
+            c.text,
+            c.start_offset,
+            c.end_offset,
+            c.page_number,
+            d.title,
+            d.path,
+            rank
+        FROM chunks_fts 
+        JOIN chunks c ON chunks_fts.rowid = c.rowid
+        JOIN docs d ON c.doc_id = d.doc_id
+        WHERE chunks_fts MATCH ?
+        ORDER BY rank
+        LIMIT ?
+    """
+    
+    def __init__(self, db_path: str | Path, pragmas: Optional[Dict[str, Any]] = None):
         """Initialize database connection.
         
         Args:
             db_path: Path to SQLite database file
+            pragmas: Optional PRAGMA settings applied when the connection opens
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.pragmas = dict(pragmas or {})
         self._conn: Optional[sqlite3.Connection] = None
+        self._transaction_depth = 0
         
     def connect(self) -> sqlite3.Connection:
         """Get database connection, creating if needed."""
         if self._conn is None:
             self._conn = sqlite3.connect(
                 self.db_path,
-                check_same_thread=False
+                check_same_thread=False,
+                cached_statements=self.CACHED_STATEMENTS
             )
             self._conn.row_factory = sqlite3.Row
             # Enable FTS5
             self._conn.execute("PRAGMA foreign_keys = ON")
+            for name, value in self.pragmas.items():
+                self._conn.execute(f"PRAGMA {name} = {value}")
         return self._conn
     
     def close(self):
@@ -41,6 +79,35 @@ class CorpusDatabase:
             self._conn.close()
             self._conn = None
     
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Group writes into a single transaction.
+        
+        Commits issued by the write methods are deferred until the outermost
+        transaction block exits. The block is rolled back if it raises.
+        
+        Yields:
+            The underlying database connection
+        """
+        conn = self.connect()
+        self._transaction_depth += 1
+        try:
+            yield conn
+        except Exception:
+            if self._transaction_depth == 1:
+                conn.rollback()
+            raise
+        else:
+            if self._transaction_depth == 1:
+                conn.commit()
+        finally:
+            self._transaction_depth -= 1
+    
+    def _commit(self):
+        """Commit pending writes unless inside a transaction block."""
+        if self._transaction_depth == 0:
+            self.connect().commit()
+    
     def initialize_schema(self):
         """Create database tables and FTS5 virtual table."""
         conn = self.connect()
@@ -122,7 +189,7 @@ class CorpusDatabase:
                 "INSERT INTO docs (doc_id, title, path) VALUES (?, ?, ?)",
                 (doc_id, title, path)
             )
-            conn.commit()
+            self._commit()
             logger.info(f"Added document: {doc_id}")
             return True
         except sqlite3.IntegrityError:
@@ -155,7 +222,7 @@ class CorpusDatabase:
                VALUES (?, ?, ?, ?, ?)""",
             (doc_id, text, start_offset, end_offset, page_number)
         )
-        conn.commit()
+        self._commit()
         return cursor.lastrowid
     
     def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
@@ -170,58 +237,147 @@ class CorpusDatabase:
         """
         conn = self.connect()
         
+        fts_query = self._build_fts_query(query)
+        if not fts_query:
+            return []
+        
+        cursor = conn.execute(self.SEARCH_SQL, (fts_query, limit))
+        
+        return [self._search_result(row) for row in cursor.fetchall()]
+    
+    def search_many(self, queries: List[str], limit: int = 5) -> Dict[str, List[Dict[str, Any]]]:
+        """Search for several queries with a single FTS5 statement.
+        
+        The per-query searches are combined with UNION ALL so they are
+        prepared and executed in one round trip.
+        
+        Args:
+            queries: Search queries
+            limit: Maximum number of results per query
+            
+        Returns:
+            Mapping of each query to its results, as returned by search()
+        """
+        results: Dict[str, List[Dict[str, Any]]] = {query: [] for query in queries}
+        unique_queries = list(results)
+        
+        fts_queries = [
+            (index, fts_query)
+            for index, fts_query in enumerate(self._build_fts_query(query) for query in unique_queries)
+            if fts_query
+        ]
+        if not fts_queries:
+            return results
+        
+        conn = self.connect()
+        
+        # Stay well below SQLite's limit on terms in a compound SELECT
+        for batch_start in range(0, len(fts_queries), self.MAX_COMPOUND_SEARCHES):
+            batch = fts_queries[batch_start:batch_start + self.MAX_COMPOUND_SEARCHES]
+            
+            sql = " UNION ALL ".join("""
+                SELECT * FROM (
+                    SELECT 
+                        ? AS query_index,
+                        c.rowid AS rowid,
+                        c.doc_id,
+                        c.text,
+                        c.start_offset,
+                        c.end_offset,
+                        c.page_number,
+                        d.title,
+                        d.path,
+                        rank
+                    FROM chunks_fts 
+                    JOIN chunks c ON chunks_fts.rowid = c.rowid
+                    JOIN docs d ON c.doc_id = d.doc_id
+                    WHERE chunks_fts MATCH ?
+                    ORDER BY rank
+                    LIMIT ?
+                )
+            """ for _ in batch) + " ORDER BY query_index, rank"
+            params = [param for index, fts_query in batch for param in (index, fts_query, limit)]
+            
+            for row in conn.execute(sql, params):
+                results[unique_queries[row["query_index"]]].append(self._search_result(row))
+        
+        return results
+    
+    def keywords_present(self, keywords: List[str]) -> Dict[str, int]:
+        """Count the chunks matching each keyword with a single FTS5 statement.
+        
+        Keywords are matched the same way as search() queries.
+        
+        Args:
+            keywords: Keywords to look up
+        
+        Returns:
+            Mapping of each keyword to the number of chunks it matches
+        """
+        counts: Dict[str, int] = dict.fromkeys(keywords, 0)
+        unique_keywords = list(counts)
+        
+        fts_queries = [
+            (index, fts_query)
+            for index, fts_query in enumerate(self._build_fts_query(keyword) for keyword in unique_keywords)
+            if fts_query
+        ]
+        if not fts_queries:
+            return counts
+        
+        conn = self.connect()
+        
+        for batch_start in range(0, len(fts_queries), self.MAX_COMPOUND_SEARCHES):
+            batch = fts_queries[batch_start:batch_start + self.MAX_COMPOUND_SEARCHES]
+            
+            sql = " UNION ALL ".join(
+                "SELECT ? AS keyword_index, COUNT(*) AS matches FROM chunks_fts WHERE chunks_fts MATCH ?"
+                for _ in batch
+            )
+            params = [param for index, fts_query in batch for param in (index, fts_query)]
+            
+            for row in conn.execute(sql, params):
+                counts[unique_keywords[row["keyword_index"]]] = row["matches"]
+        
+        return counts
+    
+    @staticmethod
+    def _build_fts_query(query: str) -> str:
+        """Convert a free-text query into an FTS5 MATCH expression.
+        
+        Args:
+            query: Search query
+            
+        Returns:
+            FTS5 query string, empty if the query has no searchable terms
+        """
         # Sanitize query for FTS5 - remove punctuation and special characters
-        import re
         sanitized_query = re.sub(r'[^\w\s]', ' ', query)  # Replace punctuation with spaces
         sanitized_query = re.sub(r'\s+', ' ', sanitized_query).strip()  # Normalize whitespace
         
         if not sanitized_query:
-            return []
+            return ""
         
         # Convert multi-word queries to OR syntax for better matching
         query_terms = [term.strip() for term in sanitized_query.split() if term.strip()]
         if len(query_terms) > 1:
-            fts_query = " OR ".join(f'"{term}"' for term in query_terms)  # Quote each term
-        else:
-            fts_query = f'"{query_terms[0]}"' if query_terms else ""
-        
-        if not fts_query:
-            return []
-        
-        cursor = conn.execute("""
-            SELECT 
-                c.rowid,
-                c.doc_id,
-                c.text,
-                c.start_offset,
-                c.end_offset,
-                c.page_number,
-                d.title,
-                d.path,
-                rank
-            FROM chunks_fts 
-            JOIN chunks c ON chunks_fts.rowid = c.rowid
-            JOIN docs d ON c.doc_id = d.doc_id
-            WHERE chunks_fts MATCH ?
-            ORDER BY rank
-            LIMIT ?
-        """, (fts_query, limit))
-        
-        results = []
-        for row in cursor.fetchall():
-            results.append({
-                "chunk_id": row["rowid"],
-                "doc_id": row["doc_id"],
-                "text": row["text"],
-                "start_offset": row["start_offset"],
-                "end_offset": row["end_offset"],
-                "page_number": row["page_number"],
-                "doc_title": row["title"],
-                "doc_path": row["path"],
-                "rank": row["rank"]
-            })
-        
-        return results
+            return " OR ".join(f'"{term}"' for term in query_terms)  # Quote each term
+        return f'"{query_terms[0]}"' if query_terms else ""
+    
+    @staticmethod
+    def _search_result(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a search result row into a result dictionary."""
+        return {
+            "chunk_id": row["rowid"],
+            "doc_id": row["doc_id"],
+            "text": row["text"],
+            "start_offset": row["start_offset"],
+            "end_offset": row["end_offset"],
+            "page_number": row["page_number"],
+            "doc_title": row["title"],
+            "doc_path": row["path"],
+            "rank": row["rank"]
+        }
     
     def get_chunk_by_id(self, chunk_id: int) -> Optional[Dict[str, Any]]:
         """Get specific chunk by ID.
@@ -323,6 +479,95 @@ class CorpusDatabase:
         
         return results
     
+    def get_chunks_for_documents(self, doc_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Get chunks for several documents with a single query.
+        
+        Args:
+            doc_ids: Document identifiers
+            
+        Returns:
+            Mapping of document ID to its chunks ordered by start offset.
+            Documents without chunks map to an empty list.
+        """
+        results: Dict[str, List[Dict[str, Any]]] = {doc_id: [] for doc_id in doc_ids}
+        if not results:
+            return results
+        
+        conn = self.connect()
+        placeholders = ", ".join("?" for _ in results)
+        cursor = conn.execute(f"""
+            SELECT 
+                c.rowid,
+                c.doc_id,
+                c.text,
+                c.start_offset,
+                c.end_offset,
+                c.page_number,
+                d.title,
+                d.path
+            FROM chunks c
+            JOIN docs d ON c.doc_id = d.doc_id
+            WHERE c.doc_id IN ({placeholders})
+            ORDER BY c.doc_id, c.start_offset
+        """, list(results))
+        
+        for row in cursor.fetchall():
+            results[row["doc_id"]].append({
+                "chunk_id": row["rowid"],
+                "doc_id": row["doc_id"],
+                "text": row["text"],
+                "start_offset": row["start_offset"],
+                "end_offset": row["end_offset"],
+                "page_number": row["page_number"],
+                "doc_title": row["title"],
+                "doc_path": row["path"]
+            })
+        
+        return results
+    
+    def get_all_chunks_grouped(self) -> List[Tuple[str, List[Dict[str, Any]]]]:
+        """Get the chunks of every document with a single joined query.
+        
+        Returns:
+            List of (doc_id, chunks) pairs ordered by document ID, with each
+            document's chunks ordered by start offset. Documents without
+            chunks are included with an empty list.
+        """
+        conn = self.connect()
+        cursor = conn.execute("""
+            SELECT 
+                d.doc_id,
+                d.title,
+                d.path,
+                c.rowid AS chunk_id,
+                c.text,
+                c.start_offset,
+                c.end_offset,
+                c.page_number
+            FROM docs d
+            LEFT JOIN chunks c ON c.doc_id = d.doc_id
+            ORDER BY d.doc_id, c.start_offset
+        """)
+        
+        grouped = []
+        for doc_id, rows in groupby(cursor.fetchall(), key=lambda row: row["doc_id"]):
+            grouped.append((doc_id, [
+                {
+                    "chunk_id": row["chunk_id"],
+                    "doc_id": row["doc_id"],
+                    "text": row["text"],
+                    "start_offset": row["start_offset"],
+                    "end_offset": row["end_offset"],
+                    "page_number": row["page_number"],
+                    "doc_title": row["title"],
+                    "doc_path": row["path"]
+                }
+                for row in rows
+                if row["chunk_id"] is not None
+            ]))
+        
+        return grouped
+    
     def get_document_info(self, doc_id: str) -> Optional[Dict[str, Any]]:
         """Get document metadata.
         
@@ -348,6 +593,37 @@ class CorpusDatabase:
             }
         return None
     
+    def get_documents_info(self, doc_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get metadata for several documents with a single query.
+        
+        Args:
+            doc_ids: Document identifiers
+            
+        Returns:
+            Mapping of document ID to its info, as returned by
+            get_document_info(). Unknown documents are omitted.
+        """
+        unique_ids = list(dict.fromkeys(doc_ids))
+        if not unique_ids:
+            return {}
+        
+        conn = self.connect()
+        placeholders = ", ".join("?" for _ in unique_ids)
+        cursor = conn.execute(
+            f"SELECT doc_id, title, path, created_at FROM docs WHERE doc_id IN ({placeholders})",
+            unique_ids
+        )
+        
+        return {
+            row["doc_id"]: {
+                "doc_id": row["doc_id"],
+                "title": row["title"],
+                "path": row["path"],
+                "created_at": row["created_at"]
+            }
+            for row in cursor.fetchall()
+        }
+    
     def list_documents(self) -> List[Dict[str, Any]]:
         """List all documents in corpus.
         
@@ -370,6 +646,40 @@ class CorpusDatabase:
         
         return results
     
+    def count_documents(self) -> int:
+        """Count documents in corpus.
+        
+        Returns:
+            Number of documents
+        """
+        conn = self.connect()
+        return conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+    
+    def sample_documents(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """Get the first few documents in corpus, as ordered by list_documents().
+        
+        Args:
+            limit: Maximum number of documents to return
+            
+        Returns:
+            List of document metadata
+        """
+        conn = self.connect()
+        cursor = conn.execute(
+            "SELECT doc_id, title, path, created_at FROM docs ORDER BY title LIMIT ?",
+            (limit,)
+        )
+        
+        return [
+            {
+                "doc_id": row["doc_id"],
+                "title": row["title"],
+                "path": row["path"],
+                "created_at": row["created_at"]
+            }
+            for row in cursor.fetchall()
+        ]
+    
     def delete_document(self, doc_id: str) -> bool:
         """Delete document and all its chunks.
         
@@ -389,7 +699,7 @@ class CorpusDatabase:
         cursor = conn.execute("DELETE FROM docs WHERE doc_id = ?", (doc_id,))
         doc_deleted = cursor.rowcount > 0
         
-        conn.commit()
+        self._commit()
         
         if doc_deleted:
             logger.info(f"Deleted document {doc_id} with {chunks_deleted} chunks")
@@ -241,56 +241,77 @@ class DocumentIngester:
         Returns:
             Validation results
         """
-        doc_info = self.database.get_document_info(doc_id)
-        if not doc_info:
-            return {
-                "doc_id": doc_id,
-                "valid": False,
-                "error": "Document not found"
-            }
+        return self.validate_ingestion_batch([doc_id])[doc_id]
+    
+    def validate_ingestion_batch(self, doc_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Validate several ingested documents in one pass.
         
-        # Get chunks
-        chunks = self.database.get_document_chunks(doc_id)
+        Chunks for all documents are fetched with a single query and the
+        corpus-wide search test runs once for the whole batch.
         
-        # Basic validation checks
-        issues = []
+        Args:
+            doc_ids: Document IDs to validate
+            
+        Returns:
+            Mapping of document ID to validation results
+        """
+        documents = self.database.get_documents_info(doc_ids)
+        chunks_by_doc = self.database.get_chunks_for_documents(doc_ids)
         
-        if not chunks:
-            issues.append("No chunks found")
+        # Test search functionality
+        search_error = None
+        try:
+            self.database.search("emergency", limit=1)
+        except Exception as e:
+            search_error = e
         
-        # Check for gaps in offsets
-        if len(chunks) > 1:
-            sorted_chunks = sorted(chunks, key=lambda x: x["start_offset"])
-            for i in range(1, len(sorted_chunks)):
-                prev_end = sorted_chunks[i-1]["end_offset"]
-                curr_start = sorted_chunks[i]["start_offset"]
+        validations = {}
+        for doc_id in doc_ids:
+            doc_info = documents.get(doc_id)
+            if not doc_info:
+                validations[doc_id] = {
+                    "doc_id": doc_id,
+                    "valid": False,
+                    "error": "Document not found"
+                }
+                continue
+            
+            chunks = chunks_by_doc[doc_id]
+            
+            # Basic validation checks
+            issues = []
+            
+            if not chunks:
+                issues.append("No chunks found")
+            
+            # Check for gaps in offsets (chunks are ordered by start offset)
+            for i in range(1, len(chunks)):
+                prev_end = chunks[i-1]["end_offset"]
+                curr_start = chunks[i]["start_offset"]
                 
                 # Allow some gap for overlap, but not too much
                 if curr_start > prev_end + 100:
                     issues.append(f"Large gap between chunks {i-1} and {i}")
+            
+            # Check for empty chunks
+            empty_chunks = [c for c in chunks if not c["text"].strip()]
+            if empty_chunks:
+                issues.append(f"Found {len(empty_chunks)} empty chunks")
+            
+            if search_error is not None:
+                issues.append(f"Search test failed: {search_error}")
+            
+            validations[doc_id] = {
+                "doc_id": doc_id,
+                "valid": len(issues) == 0,
+                "document_info": doc_info,
+                "chunk_count": len(chunks),
+                "issues": issues,
+                "search_functional": search_error is None,
+                "validation_timestamp": datetime.now().isoformat()
+            }
         
-        # Check for empty chunks
-        empty_chunks = [c for c in chunks if not c["text"].strip()]
-        if empty_chunks:
-            issues.append(f"Found {len(empty_chunks)} empty chunks")
-        
-        # Test search functionality
-        try:
-            search_results = self.database.search("emergency", limit=1)
-            search_works = len(search_results) >= 0  # Even 0 results means search works
-        except Exception as e:
-            search_works = False
-            issues.append(f"Search test failed: {e}")
-        
-        return {
-            "doc_id": doc_id,
-            "valid": len(issues) == 0,
-            "document_info": doc_info,
-            "chunk_count": len(chunks),
-            "issues": issues,
-            "search_functional": search_works,
-            "validation_timestamp": datetime.now().isoformat()
-        }
+        return validations
     
     def get_ingestion_stats(self) -> Dict[str, Any]:
         """Get overall corpus ingestion statistics.
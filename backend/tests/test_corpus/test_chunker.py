@@ -148,6 +148,26 @@ class TestTextChunker:
             assert "page_numbers" in chunk.metadata
             assert chunk.metadata["doc_id"] == "test_doc"
     
+    def test_chunk_with_segments_page_spans(self, chunker):
+        """Test that chunks report exactly the pages they overlap."""
+        segments = [
+            TextSegment("Page one text. " * 4, 1, 0, 60),
+            TextSegment("Page two text. " * 4, 2, 60, 120),
+            TextSegment("Page three text. " * 4, 3, 120, 188)
+        ]
+
+        chunks = chunker.chunk_with_segments(segments, doc_id="test_doc")
+
+        for chunk in chunks:
+            expected_pages = sorted(
+                segment.page_number for segment in segments
+                if segment.start_offset < chunk.end_offset and segment.end_offset > chunk.start_offset
+            )
+            assert chunk.page_numbers == expected_pages
+
+        assert chunks[0].page_numbers[0] == 1
+        assert chunks[-1].page_numbers[-1] == 3
+
     def test_chunk_with_empty_segments(self, chunker):
         """Test chunking with empty segments list."""
         chunks = chunker.chunk_with_segments([])
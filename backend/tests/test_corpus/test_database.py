@@ -118,6 +118,41 @@ class TestCorpusDatabase:
         results = temp_db.search("nonexistent")
         assert len(results) == 0
     
+    def test_search_many(self, temp_db):
+        """Test running several searches in one statement."""
+        temp_db.add_document("test_doc", "Test Document", "/path/to/test.pdf")
+        temp_db.add_chunk("test_doc", "Emergency procedures for fire safety.", 0, 37, 1)
+        temp_db.add_chunk("test_doc", "First aid treatment for burns and injuries.", 38, 81, 1)
+        temp_db.add_chunk("test_doc", "Emergency first aid kit contents.", 82, 115, 1)
+        
+        queries = ["emergency", "first aid", "nonexistent", "?!", "emergency"]
+        results = temp_db.search_many(queries, limit=2)
+        
+        assert set(results) == set(queries)
+        for query in queries:
+            assert results[query] == temp_db.search(query, limit=2)
+        assert len(results["emergency"]) == 2
+        assert results["nonexistent"] == []
+        assert results["?!"] == []
+    
+    def test_keywords_present(self, temp_db):
+        """Test counting keyword matches in one statement."""
+        temp_db.add_document("test_doc", "Test Document", "/path/to/test.pdf")
+        temp_db.add_chunk("test_doc", "Emergency procedures for fire safety.", 0, 37, 1)
+        temp_db.add_chunk("test_doc", "First aid treatment for burns and injuries.", 38, 81, 1)
+        temp_db.add_chunk("test_doc", "Emergency first aid kit contents.", 82, 115, 1)
+        
+        counts = temp_db.keywords_present(["emergency", "burns", "first aid", "nonexistent", "?!"])
+        
+        assert counts == {
+            "emergency": 2,
+            "burns": 1,
+            "first aid": 2,
+            "nonexistent": 0,
+            "?!": 0
+        }
+        assert temp_db.keywords_present([]) == {}
+    
     def test_get_document_chunks(self, temp_db):
         """Test retrieving chunks for a document."""
         # Add document and chunks
@@ -151,6 +186,38 @@ class TestCorpusDatabase:
         chunks = temp_db.get_document_chunks("test_doc", start_offset=100, end_offset=200)
         assert len(chunks) == 0
     
+    def test_get_chunks_for_documents(self, temp_db):
+        """Test fetching chunks for several documents at once."""
+        temp_db.add_document("doc1", "Document 1", "/path/to/doc1.pdf")
+        temp_db.add_document("doc2", "Document 2", "/path/to/doc2.pdf")
+        temp_db.add_chunk("doc1", "Second chunk", 50, 62, 1)
+        temp_db.add_chunk("doc1", "First chunk", 0, 11, 1)
+        temp_db.add_chunk("doc2", "Other chunk", 0, 11, 1)
+        
+        chunks = temp_db.get_chunks_for_documents(["doc1", "doc3"])
+        
+        assert set(chunks) == {"doc1", "doc3"}
+        assert [c["text"] for c in chunks["doc1"]] == ["First chunk", "Second chunk"]
+        assert chunks["doc1"][0]["doc_title"] == "Document 1"
+        assert chunks["doc3"] == []
+        assert temp_db.get_chunks_for_documents([]) == {}
+    
+    def test_get_all_chunks_grouped(self, temp_db):
+        """Test fetching every document's chunks grouped by document."""
+        temp_db.add_document("doc2", "Document 2", "/path/to/doc2.pdf")
+        temp_db.add_document("doc1", "Document 1", "/path/to/doc1.pdf")
+        temp_db.add_document("doc3", "Document 3", "/path/to/doc3.pdf")
+        temp_db.add_chunk("doc1", "Second chunk", 50, 62, 1)
+        temp_db.add_chunk("doc1", "First chunk", 0, 11, 1)
+        temp_db.add_chunk("doc2", "Other chunk", 0, 11, 1)
+        
+        grouped = temp_db.get_all_chunks_grouped()
+        
+        assert [doc_id for doc_id, _ in grouped] == ["doc1", "doc2", "doc3"]
+        assert [c["text"] for c in grouped[0][1]] == ["First chunk", "Second chunk"]
+        assert grouped[1][1][0]["doc_title"] == "Document 2"
+        assert grouped[2][1] == []
+    
     def test_delete_document(self, temp_db):
         """Test document deletion."""
         # Add document and chunks
@@ -197,6 +264,30 @@ class TestCorpusDatabase:
         assert "doc1" in doc_ids
         assert "doc2" in doc_ids
     
+    def test_get_documents_info(self, temp_db):
+        """Test fetching metadata for several documents at once."""
+        temp_db.add_document("doc1", "Document 1", "/path/to/doc1.pdf")
+        temp_db.add_document("doc2", "Document 2", "/path/to/doc2.pdf")
+        
+        docs = temp_db.get_documents_info(["doc1", "doc3", "doc1"])
+        
+        assert docs == {"doc1": temp_db.get_document_info("doc1")}
+        assert temp_db.get_documents_info([]) == {}
+    
+    def test_count_and_sample_documents(self, temp_db):
+        """Test counting documents and sampling a preview."""
+        assert temp_db.count_documents() == 0
+        assert temp_db.sample_documents() == []
+        
+        for i in range(3):
+            temp_db.add_document(f"doc{i}", f"Document {i}", f"/path/to/doc{i}.pdf")
+        
+        assert temp_db.count_documents() == 3
+        
+        sample = temp_db.sample_documents(2)
+        assert [doc["doc_id"] for doc in sample] == ["doc0", "doc1"]
+        assert sample == temp_db.list_documents()[:2]
+    
     def test_get_stats(self, temp_db):
         """Test corpus statistics."""
         # Initially empty
@@ -237,4 +328,41 @@ class TestCorpusDatabase:
         
         # Search should not find the chunk anymore
         results = temp_db.search("emergency")
-        assert len(results) == 0
\ No newline at end of file
+        assert len(results) == 0
+    
+    def test_connection_pragmas(self, temp_db):
+        """Test that configured PRAGMAs are applied on connect."""
+        db = CorpusDatabase(temp_db.db_path, pragmas={"synchronous": "NORMAL", "cache_size": -2000})
+        try:
+            conn = db.connect()
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -2000
+        finally:
+            db.close()
+    
+    def test_transaction_defers_commit(self, temp_db):
+        """Test that writes inside a transaction commit once on exit."""
+        other = sqlite3.connect(temp_db.db_path)
+        try:
+            with temp_db.transaction():
+                temp_db.add_document("test_doc", "Test Document", "/path/to/test.pdf")
+                temp_db.add_chunk("test_doc", "Chunk 1", 0, 7, 1)
+                
+                # Not yet visible to other connections
+                assert other.execute("SELECT COUNT(*) FROM chunks").fetchone()[0] == 0
+            
+            assert other.execute("SELECT COUNT(*) FROM chunks").fetchone()[0] == 1
+        finally:
+            other.close()
+    
+    def test_transaction_rollback(self, temp_db):
+        """Test that a failing transaction discards its writes."""
+        with pytest.raises(RuntimeError):
+            with temp_db.transaction():
+                temp_db.add_document("test_doc", "Test Document", "/path/to/test.pdf")
+                temp_db.add_chunk("test_doc", "Chunk 1", 0, 7, 1)
+                raise RuntimeError("boom")
+        
+        stats = temp_db.get_stats()
+        assert stats["documents"] == 0
+        assert stats["chunks"] == 0
@@ -258,6 +258,23 @@ class TestDocumentIngester:
         assert validation["valid"] is False
         assert "No chunks found" in validation["issues"]
     
+    def test_validate_ingestion_batch(self, ingester):
+        """Test validating several documents at once."""
+        ingester.database.add_document("doc1", "Document 1", "/path/to/doc1.pdf")
+        ingester.database.add_document("doc2", "Document 2", "/path/to/doc2.pdf")
+        ingester.database.add_chunk("doc1", "Emergency procedures", 0, 19, 1)
+        ingester.database.add_chunk("doc1", "First aid steps", 500, 515, 1)
+        
+        validations = ingester.validate_ingestion_batch(["doc1", "doc2", "missing"])
+        
+        assert set(validations) == {"doc1", "doc2", "missing"}
+        assert validations["doc1"]["valid"] is False
+        assert validations["doc1"]["chunk_count"] == 2
+        assert "Large gap between chunks 0 and 1" in validations["doc1"]["issues"]
+        assert validations["doc2"]["valid"] is False
+        assert "No chunks found" in validations["doc2"]["issues"]
+        assert validations["missing"]["error"] == "Document not found"
+    
     def test_get_ingestion_stats(self, ingester):
         """Test getting ingestion statistics."""
         # Add some test data
@@ -0,0 +1,39 @@
+"""
+Tests for the corpus verification script helpers.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+
+from verify_corpus import CorpusVerifier
+
+
+class TestFindKeywords:
+    """Test cases for CorpusVerifier._find_keywords."""
+    
+    def test_find_keywords(self):
+        """Test finding keywords across chunks, ignoring case."""
+        found = CorpusVerifier._find_keywords(
+            ["Apply First Aid", "then call for help"],
+            ["first aid", "aid", "first", "Help", "CPR"]
+        )
+        
+        assert found == {"first aid", "aid", "first", "help"}
+    
+    def test_find_keywords_empty(self):
+        """Test finding keywords with no texts or no keywords."""
+        assert CorpusVerifier._find_keywords([], ["help"]) == set()
+        assert CorpusVerifier._find_keywords(["help"], []) == set()
+    
+    def test_find_keywords_non_ascii_case_folding(self):
+        """Test that characters folding to ASCII letters neither match nor hang."""
+        # U+017F (long s) matches "s" under re.IGNORECASE but is unchanged
+        # by lower(), so it must not count as a match for "support"
+        found = CorpusVerifier._find_keywords(
+            ["psychological ſupport here", "Keep calm"],
+            ["support", "trauma", "keep"]
+        )
+        
+        assert found == {"keep"}
@@ -40,10 +40,10 @@ if [ ! -f "$CAMPFIRE_CORPUS_DB" ]; then
 else
     echo "✅ Corpus database found"
     
-    # Verify corpus integrity
+    # Verify corpus integrity (quick mode; run the full verification in CI)
     echo "🔍 Verifying corpus integrity..."
     cd /app
-    if /app/.venv/bin/python scripts/verify_corpus.py; then
+    if /app/.venv/bin/python scripts/verify_corpus.py --quick; then
         echo "✅ Corpus verification passed"
     else
         echo "⚠️  Corpus verification failed, but continuing..."
@@ -85,7 +85,7 @@ fi
 # System health check
 echo "🏥 Running comprehensive startup health check..."
 cd /app
-if /app/.venv/bin/python scripts/startup_health_check.py; then
+if /app/.venv/bin/python scripts/startup_health_check.py --init-db; then
     echo "✅ Comprehensive health check passed"
 else
     echo "❌ Comprehensive health check failed"
@@ -0,0 +1,14 @@
+"""
+Make the Campfire backend importable from the scripts directory.
+
+Importing this module adds backend/src to sys.path once, however many
+scripts or helper modules import it.
+"""
+
+import sys
+from pathlib import Path
+
+BACKEND_SRC = str(Path(__file__).resolve().parent.parent / "backend" / "src")
+
+if BACKEND_SRC not in sys.path:
+    sys.path.insert(0, BACKEND_SRC)
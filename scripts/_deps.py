@@ -0,0 +1,25 @@
+"""
+Required Python packages checked by the startup scripts.
+
+Shared by startup_health_check.py and validate_config.py so both scripts
+check the same set of packages.
+"""
+
+# (package name, import name, description)
+REQUIRED_PACKAGES = (
+    ("fastapi", "fastapi", "FastAPI web framework"),
+    ("uvicorn", "uvicorn", "ASGI server"),
+    ("pydantic", "pydantic", "Data validation"),
+    ("sqlalchemy", "sqlalchemy", "Database ORM"),
+    ("openai_harmony", "openai_harmony", "Harmony integration"),
+    ("pdfminer", "pdfminer", "PDF processing"),
+    ("rich", "rich", "Rich text output"),
+    ("typer", "typer", "CLI framework"),
+    ("httpx", "httpx", "HTTP client"),
+    ("python_multipart", "multipart", "Form data parsing"),
+    ("jinja2", "jinja2", "Template rendering"),
+    ("python_jose", "jose", "JWT handling"),
+    ("passlib", "passlib", "Password hashing"),
+    ("python_dotenv", "dotenv", "Environment file loading"),
+    ("psutil", "psutil", "System utilities"),
+)
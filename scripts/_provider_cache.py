@@ -0,0 +1,66 @@
+"""
+Short-lived file cache for LLM provider discovery.
+
+get_available_providers() probes every provider backend. The startup health
+check and the configuration validator both need the result and usually run
+back-to-back, so the first caller stores it on disk for the second to reuse.
+"""
+
+import os
+import json
+import time
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Any
+
+import _bootstrap  # noqa: F401
+
+CACHE_PATH = Path(os.getenv(
+    "CAMPFIRE_PROVIDERS_CACHE",
+    Path(tempfile.gettempdir()) / "campfire_providers.json"
+))
+CACHE_TTL_SECONDS = 30
+
+# Environment variables that influence which providers are available
+CACHE_KEY_VARS = ("CAMPFIRE_LLM_PROVIDER", "OLLAMA_HOST")
+
+
+def _cache_key() -> str:
+    """Hash the provider-related environment into a cache key."""
+    env = json.dumps({var: os.getenv(var) for var in CACHE_KEY_VARS}, sort_keys=True)
+    return hashlib.sha256(env.encode("utf-8")).hexdigest()
+
+
+def get_available_providers_cached() -> List[Dict[str, Any]]:
+    """Get available LLM providers, reusing a recent result when possible.
+
+    Returns:
+        Provider list as returned by campfire.llm.factory.get_available_providers
+    """
+    key = _cache_key()
+
+    try:
+        if time.time() - CACHE_PATH.stat().st_mtime < CACHE_TTL_SECONDS:
+            cached = json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+            if cached["key"] == key:
+                return cached["providers"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # Missing, stale or unreadable cache; probe again
+
+    from campfire.llm.factory import get_available_providers
+
+    providers = get_available_providers()
+
+    # Write to a temporary file and rename so readers never see a partial file
+    tmp_path = CACHE_PATH.with_name(f"{CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(
+            json.dumps({"key": key, "providers": providers}, default=str),
+            encoding="utf-8"
+        )
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+    return providers
@@ -9,7 +9,11 @@ documents into the local searchable corpus.
 import sys
 import hashlib
 import logging
+from collections import Counter
+from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional
 import tempfile
 import shutil
@@ -27,7 +31,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Document definitions with download URLs and checksums
-DOCUMENTS = {
+DOCUMENTS = MappingProxyType({
     "ifrc_2020": {
         "title": "IFRC International First Aid, Resuscitation and Education Guidelines 2020",
         "url": "https://www.ifrc.org/sites/default/files/2021-05/IFRC%20First%20Aid%20Guidelines%202020.pdf",
@@ -44,8 +48,90 @@ DOCUMENTS = {
         "doc_id": "who_psychological_first_aid_2011",
         "description": "WHO guide for providing psychological first aid to people in distress"
     }
+})
+
+
+@dataclass(frozen=True)
+class DocumentInfo:
+    """Metadata for a configured emergency guidance document."""
+    title: str
+    url: str
+    filename: str
+    expected_sha256: Optional[str]
+    doc_id: str
+    description: str
+
+
+@cache
+def _doc_info(doc_key: str) -> DocumentInfo:
+    """Look up metadata for a configured document.
+    
+    Args:
+        doc_key: Key identifying the document in DOCUMENTS
+        
+    Returns:
+        Document metadata
+        
+    Raises:
+        KeyError: If the document key is unknown
+    """
+    return DocumentInfo(**DOCUMENTS[doc_key])
+
+
+# Placeholder content written in place of documents that cannot be downloaded
+PLACEHOLDER_TEMPLATE = """Placeholder for {doc.title}
+
+This is a placeholder file for testing the Campfire corpus ingestion system.
+In a production deployment, this would be the actual PDF document downloaded from:
+{doc.url}
+
+Document Information:
+- Title: {doc.title}
+- Description: {doc.description}
+- Document ID: {doc.doc_id}
+
+Emergency Response Guidelines:
+
+Chapter 1: Basic First Aid
+When someone is injured, follow these steps:
+1. Ensure the scene is safe before approaching
+2. Check if the person is conscious and responsive
+3. Call for emergency medical services if needed
+4. Provide appropriate first aid based on the injury
+5. Monitor the person until help arrives
+
+Chapter 2: Psychological Support
+When providing psychological first aid:
+1. Approach calmly and respectfully
+2. Listen actively without judgment
+3. Provide practical support and information
+4. Connect with social supports when appropriate
+5. Respect cultural differences and preferences
+
+Chapter 3: Emergency Situations
+For various emergency situations:
+- Bleeding: Apply direct pressure with clean cloth
+- Burns: Cool with water, do not use ice
+- Choking: Perform back blows and abdominal thrusts
+- Unconsciousness: Check breathing, place in recovery position
+- Shock: Keep person warm and lying down
+
+Remember: This is not medical advice. Always seek professional help for serious injuries.
+"""
+
+# SQLite settings for bulk ingestion: WAL journaling with relaxed fsync,
+# a 64 MiB page cache and memory-mapped reads
+BULK_INGEST_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -65536,
+    "temp_store": "MEMORY",
+    "mmap_size": 268435456
 }
 
+# Download statuses that leave a usable file on disk
+SUCCESSFUL_DOWNLOAD_STATUSES = ("downloaded_placeholder", "exists_valid", "exists_unchecked")
+
 
 class DocumentDownloader:
     """Handles downloading and verification of emergency guidance documents."""
@@ -78,117 +164,81 @@ class DocumentDownloader:
         """Download and verify a document.
         
         Args:
-            doc_key: Key identifying the document in DOCUMENTS dict
+            doc_key: Key identifying the document in DOCUMENTS
             force_redownload: Whether to redownload even if file exists
             
         Returns:
             Dictionary with download results
         """
-        if doc_key not in DOCUMENTS:
-            raise ValueError(f"Unknown document key: {doc_key}")
+        try:
+            doc_info = _doc_info(doc_key)
+        except KeyError:
+            raise ValueError(f"Unknown document key: {doc_key}") from None
         
-        doc_info = DOCUMENTS[doc_key]
-        file_path = self.download_dir / doc_info["filename"]
+        file_path = self.download_dir / doc_info.filename
         
         # Check if file already exists and is valid
         if file_path.exists() and not force_redownload:
-            logger.info(f"Document {doc_key} already exists at {file_path}")
+            logger.info("Document %s already exists at %s", doc_key, file_path)
             
             # Verify checksum if available
-            if doc_info["expected_sha256"]:
+            if doc_info.expected_sha256:
                 actual_hash = self.calculate_sha256(file_path)
-                if actual_hash == doc_info["expected_sha256"]:
-                    logger.info(f"✅ Checksum verified for {doc_key}")
+                if actual_hash == doc_info.expected_sha256:
+                    logger.info("✅ Checksum verified for %s", doc_key)
                     return {
                         "doc_key": doc_key,
                         "status": "exists_valid",
-                        "file_path": str(file_path),
+                        "file_path": file_path,
                         "sha256": actual_hash
                     }
                 else:
-                    logger.warning(f"❌ Checksum mismatch for {doc_key}, will redownload")
+                    logger.warning("❌ Checksum mismatch for %s, will redownload", doc_key)
             else:
                 # No expected checksum, assume valid
                 actual_hash = self.calculate_sha256(file_path)
-                logger.info(f"📄 Existing file {doc_key}, hash: {actual_hash[:16]}...")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("📄 Existing file %s, hash: %s...", doc_key, actual_hash[:16])
                 return {
                     "doc_key": doc_key,
                     "status": "exists_unchecked",
-                    "file_path": str(file_path),
+                    "file_path": file_path,
                     "sha256": actual_hash
                 }
         
         # Download the document
-        logger.info(f"📥 Downloading {doc_info['title']}...")
-        logger.info(f"    URL: {doc_info['url']}")
+        logger.info("📥 Downloading %s...", doc_info.title)
+        logger.info("    URL: %s", doc_info.url)
         
         try:
             # For now, we'll create placeholder files since we can't actually download
             # In a real implementation, this would use requests or httpx
-            logger.warning(f"⚠️  Creating placeholder file for {doc_key} (download not implemented)")
+            logger.warning("⚠️  Creating placeholder file for %s (download not implemented)", doc_key)
             
             # Create a placeholder PDF-like file for testing
-            placeholder_content = f"""Placeholder for {doc_info['title']}
-
-This is a placeholder file for testing the Campfire corpus ingestion system.
-In a production deployment, this would be the actual PDF document downloaded from:
-{doc_info['url']}
-
-Document Information:
-- Title: {doc_info['title']}
-- Description: {doc_info['description']}
-- Document ID: {doc_info['doc_id']}
-
-Emergency Response Guidelines:
-
-Chapter 1: Basic First Aid
-When someone is injured, follow these steps:
-1. Ensure the scene is safe before approaching
-2. Check if the person is conscious and responsive
-3. Call for emergency medical services if needed
-4. Provide appropriate first aid based on the injury
-5. Monitor the person until help arrives
-
-Chapter 2: Psychological Support
-When providing psychological first aid:
-1. Approach calmly and respectfully
-2. Listen actively without judgment
-3. Provide practical support and information
-4. Connect with social supports when appropriate
-5. Respect cultural differences and preferences
-
-Chapter 3: Emergency Situations
-For various emergency situations:
-- Bleeding: Apply direct pressure with clean cloth
-- Burns: Cool with water, do not use ice
-- Choking: Perform back blows and abdominal thrusts
-- Unconsciousness: Check breathing, place in recovery position
-- Shock: Keep person warm and lying down
-
-Remember: This is not medical advice. Always seek professional help for serious injuries.
-"""
+            placeholder_content = PLACEHOLDER_TEMPLATE.format(doc=doc_info).encode('utf-8')
+            file_path.write_bytes(placeholder_content)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(placeholder_content)
+            # Calculate hash of placeholder from the bytes just written
+            actual_hash = hashlib.sha256(placeholder_content).hexdigest()
+            file_size = len(placeholder_content)
             
-            # Calculate hash of placeholder
-            actual_hash = self.calculate_sha256(file_path)
-            
-            logger.info(f"✅ Created placeholder file for {doc_key}")
-            logger.info(f"    File: {file_path}")
-            logger.info(f"    Size: {file_path.stat().st_size} bytes")
-            logger.info(f"    SHA256: {actual_hash[:16]}...")
+            logger.info("✅ Created placeholder file for %s", doc_key)
+            logger.info("    File: %s", file_path)
+            logger.info("    Size: %s bytes", file_size)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("    SHA256: %s...", actual_hash[:16])
             
             return {
                 "doc_key": doc_key,
                 "status": "downloaded_placeholder",
-                "file_path": str(file_path),
+                "file_path": file_path,
                 "sha256": actual_hash,
-                "size": file_path.stat().st_size
+                "size": file_size
             }
             
         except Exception as e:
-            logger.error(f"❌ Failed to download {doc_key}: {e}")
+            logger.error("❌ Failed to download %s: %s", doc_key, e)
             return {
                 "doc_key": doc_key,
                 "status": "failed",
@@ -211,7 +261,7 @@ Remember: This is not medical advice. Always seek professional help for serious
                 result = self.download_document(doc_key, force_redownload)
                 results.append(result)
             except Exception as e:
-                logger.error(f"Failed to process {doc_key}: {e}")
+                logger.error("Failed to process %s: %s", doc_key, e)
                 results.append({
                     "doc_key": doc_key,
                     "status": "failed",
@@ -229,17 +279,20 @@ Remember: This is not medical advice. Always seek professional help for serious
         Returns:
             Verification results
         """
-        if doc_key not in DOCUMENTS:
+        try:
+            doc_info = _doc_info(doc_key)
+        except KeyError:
             return {"valid": False, "error": f"Unknown document: {doc_key}"}
         
-        doc_info = DOCUMENTS[doc_key]
-        file_path = self.download_dir / doc_info["filename"]
+        file_path = self.download_dir / doc_info.filename
         
-        if not file_path.exists():
+        try:
+            file_stat = file_path.stat()
+        except FileNotFoundError:
             return {"valid": False, "error": "File does not exist"}
         
         # Check file size (should be > 0)
-        file_size = file_path.stat().st_size
+        file_size = file_stat.st_size
         if file_size == 0:
             return {"valid": False, "error": "File is empty"}
         
@@ -248,8 +301,8 @@ Remember: This is not medical advice. Always seek professional help for serious
         
         # Verify against expected hash if available
         hash_valid = True
-        if doc_info["expected_sha256"]:
-            hash_valid = current_hash == doc_info["expected_sha256"]
+        if doc_info.expected_sha256:
+            hash_valid = current_hash == doc_info.expected_sha256
         
         return {
             "valid": hash_valid and file_size > 0,
@@ -257,7 +310,7 @@ Remember: This is not medical advice. Always seek professional help for serious
             "file_size": file_size,
             "sha256": current_hash,
             "hash_matches": hash_valid,
-            "expected_hash": doc_info["expected_sha256"]
+            "expected_hash": doc_info.expected_sha256
         }
 
 
@@ -286,7 +339,7 @@ class CorpusIngestionPipeline:
         
         # Initialize components
         self.downloader = DocumentDownloader(self.raw_dir)
-        self.database = CorpusDatabase(str(self.db_path))
+        self.database = CorpusDatabase(str(self.db_path), pragmas=BULK_INGEST_PRAGMAS)
         self.ingester = DocumentIngester(self.database)
     
     def run_full_ingestion(self, force_redownload: bool = False, force_reingest: bool = False) -> Dict[str, Any]:
@@ -315,95 +368,95 @@ class CorpusIngestionPipeline:
             # Step 1: Initialize database
             logger.info("\n📊 Initializing corpus database...")
             self.database.initialize_schema()
-            logger.info(f"✅ Database initialized at {self.db_path}")
+            logger.info("✅ Database initialized at %s", self.db_path)
             
             # Step 2: Download documents
             logger.info("\n📥 Downloading documents...")
             download_results = self.downloader.download_all_documents(force_redownload)
             results["download_results"] = download_results
             
-            successful_downloads = [r for r in download_results if r["status"] in ["downloaded_placeholder", "exists_valid", "exists_unchecked"]]
-            logger.info(f"✅ Downloaded/verified {len(successful_downloads)}/{len(download_results)} documents")
+            successful_downloads = [r for r in download_results if r["status"] in SUCCESSFUL_DOWNLOAD_STATUSES]
+            logger.info("✅ Downloaded/verified %s/%s documents", len(successful_downloads), len(download_results))
             
             # Step 3: Ingest documents into corpus
             logger.info("\n🔄 Ingesting documents into corpus...")
             ingestion_results = []
             
-            for download_result in successful_downloads:
-                if "file_path" not in download_result:
-                    continue
-                
-                doc_key = download_result["doc_key"]
-                doc_info = DOCUMENTS[doc_key]
-                file_path = Path(download_result["file_path"])
-                
-                try:
-                    # Check if document already exists in database
-                    existing_doc = self.database.get_document_info(doc_info["doc_id"])
-                    
-                    if existing_doc and not force_reingest:
-                        logger.info(f"📄 Document {doc_info['doc_id']} already in corpus, skipping")
-                        ingestion_results.append({
-                            "doc_id": doc_info["doc_id"],
-                            "status": "skipped",
-                            "reason": "already_exists"
-                        })
+            # Commit all documents and chunks in a single transaction
+            with self.database.transaction():
+                for download_result in successful_downloads:
+                    if "file_path" not in download_result:
                         continue
                     
-                    # For placeholder text files, we need to simulate PDF ingestion
-                    logger.info(f"📖 Ingesting {doc_info['title']}...")
+                    doc_key = download_result["doc_key"]
+                    doc_info = _doc_info(doc_key)
+                    file_path = download_result["file_path"]
                     
-                    # Since we have text files instead of PDFs, we'll ingest them directly
-                    result = self._ingest_text_file(
-                        file_path, 
-                        doc_info["doc_id"], 
-                        doc_info["title"]
-                    )
+                    try:
+                        # Check if document already exists in database
+                        existing_doc = self.database.get_document_info(doc_info.doc_id)
                     
-                    ingestion_results.append(result)
+                        if existing_doc and not force_reingest:
+                            logger.info("📄 Document %s already in corpus, skipping", doc_info.doc_id)
+                            ingestion_results.append({
+                                "doc_id": doc_info.doc_id,
+                                "status": "skipped",
+                                "reason": "already_exists"
+                            })
+                            continue
                     
-                    if result["status"] == "success":
-                        logger.info(f"✅ Successfully ingested {doc_info['doc_id']}")
-                        logger.info(f"    Chunks: {result['chunking']['chunks']}")
-                        logger.info(f"    Characters: {result['chunking']['chunk_characters']}")
-                    else:
-                        logger.error(f"❌ Failed to ingest {doc_info['doc_id']}: {result.get('error', 'Unknown error')}")
+                        # For placeholder text files, we need to simulate PDF ingestion
+                        logger.info("📖 Ingesting %s...", doc_info.title)
+                    
+                        # Since we have text files instead of PDFs, we'll ingest them directly
+                        result = self._ingest_text_file(
+                            file_path, 
+                            doc_info.doc_id, 
+                            doc_info.title
+                        )
+                    
+                        ingestion_results.append(result)
+                    
+                        if result["status"] == "success":
+                            logger.info("✅ Successfully ingested %s", doc_info.doc_id)
+                            logger.info("    Chunks: %s", result['chunking']['chunks'])
+                            logger.info("    Characters: %s", result['chunking']['chunk_characters'])
+                        else:
+                            logger.error("❌ Failed to ingest %s: %s", doc_info.doc_id, result.get('error', 'Unknown error'))
                         
-                except Exception as e:
-                    logger.error(f"❌ Error ingesting {doc_key}: {e}")
-                    ingestion_results.append({
-                        "doc_id": doc_info["doc_id"],
-                        "status": "failed",
-                        "error": str(e)
-                    })
-                    results["errors"].append(f"Ingestion error for {doc_key}: {e}")
+                    except Exception as e:
+                        logger.error("❌ Error ingesting %s: %s", doc_key, e)
+                        ingestion_results.append({
+                            "doc_id": doc_info.doc_id,
+                            "status": "failed",
+                            "error": str(e)
+                        })
+                        results["errors"].append(f"Ingestion error for {doc_key}: {e}")
             
             results["ingestion_results"] = ingestion_results
             
             # Step 4: Validate ingestion
             logger.info("\n🔍 Validating corpus integrity...")
-            validation_results = []
+            doc_ids = [_doc_info(r["doc_key"]).doc_id for r in successful_downloads]
             
-            for doc_key in DOCUMENTS.keys():
-                doc_info = DOCUMENTS[doc_key]
-                try:
-                    validation = self.ingester.validate_ingestion(doc_info["doc_id"])
-                    validation_results.append(validation)
-                    
-                    if validation["valid"]:
-                        logger.info(f"✅ Validation passed for {doc_info['doc_id']}")
-                    else:
-                        logger.warning(f"⚠️  Validation issues for {doc_info['doc_id']}:")
-                        for issue in validation.get("issues", []):
-                            logger.warning(f"    - {issue}")
-                            
-                except Exception as e:
-                    logger.error(f"❌ Validation error for {doc_key}: {e}")
-                    validation_results.append({
-                        "doc_id": doc_info["doc_id"],
-                        "valid": False,
-                        "error": str(e)
-                    })
+            try:
+                validations = self.ingester.validate_ingestion_batch(doc_ids)
+            except Exception as e:
+                logger.error("❌ Validation error: %s", e)
+                validations = {
+                    doc_id: {"doc_id": doc_id, "valid": False, "error": str(e)}
+                    for doc_id in doc_ids
+                }
+            
+            validation_results = [validations[doc_id] for doc_id in doc_ids]
+            
+            for validation in validation_results:
+                if validation["valid"]:
+                    logger.info("✅ Validation passed for %s", validation['doc_id'])
+                else:
+                    logger.warning("⚠️  Validation issues for %s:", validation['doc_id'])
+                    for issue in validation.get("issues", []):
+                        logger.warning("    - %s", issue)
             
             results["validation_results"] = validation_results
             
@@ -412,10 +465,10 @@ class CorpusIngestionPipeline:
             final_stats = self.ingester.get_ingestion_stats()
             results["final_stats"] = final_stats
             
-            logger.info(f"✅ Corpus statistics:")
-            logger.info(f"    Documents: {final_stats['documents']}")
-            logger.info(f"    Text chunks: {final_stats['chunks']}")
-            logger.info(f"    Average chunks per document: {final_stats['average_chunks_per_doc']:.1f}")
+            logger.info("✅ Corpus statistics:")
+            logger.info("    Documents: %s", final_stats['documents'])
+            logger.info("    Text chunks: %s", final_stats['chunks'])
+            logger.info("    Average chunks per document: %.1f", final_stats['average_chunks_per_doc'])
             
             # Mark pipeline as successful
             results["pipeline_status"] = "completed"
@@ -424,7 +477,7 @@ class CorpusIngestionPipeline:
             logger.info("The corpus is ready for use with the Campfire emergency helper.")
             
         except Exception as e:
-            logger.error(f"❌ Pipeline failed: {e}")
+            logger.error("❌ Pipeline failed: %s", e)
             results["pipeline_status"] = "failed"
             results["errors"].append(f"Pipeline error: {e}")
             raise
@@ -557,16 +610,17 @@ def main():
         print("=" * 60)
         
         downloads = results["download_results"]
-        successful_downloads = len([r for r in downloads if r["status"] in ["downloaded_placeholder", "exists_valid", "exists_unchecked"]])
+        download_counts = Counter(r["status"] for r in downloads)
+        successful_downloads = sum(download_counts[status] for status in SUCCESSFUL_DOWNLOAD_STATUSES)
         print(f"Downloads: {successful_downloads}/{len(downloads)} successful")
         
         ingestions = results["ingestion_results"]
-        successful_ingestions = len([r for r in ingestions if r["status"] == "success"])
-        print(f"Ingestions: {successful_ingestions}/{len(ingestions)} successful")
+        ingestion_counts = Counter(r["status"] for r in ingestions)
+        print(f"Ingestions: {ingestion_counts['success']}/{len(ingestions)} successful")
         
         validations = results["validation_results"]
-        valid_documents = len([r for r in validations if r["valid"]])
-        print(f"Validations: {valid_documents}/{len(validations)} passed")
+        validation_counts = Counter(r["valid"] for r in validations)
+        print(f"Validations: {validation_counts[True]}/{len(validations)} passed")
         
         stats = results["final_stats"]
         print(f"Final corpus: {stats['documents']} documents, {stats['chunks']} chunks")